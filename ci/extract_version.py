@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
+import pathlib
 import sys
 import tomllib
 
 def get_version(filepath='Cargo.toml'):
-    with open(filepath, 'rb') as f:
-        data = tomllib.load(f)
+    data = tomllib.loads(pathlib.Path(filepath).read_text())
 
     version = data.get('package', {}).get('version')
 